@@ -0,0 +1,107 @@
+import math
+import numpy as np
+
+from core.constants import EPS, RADIUS_TOL
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback when numba is not installed: run kernels as plain Python"""
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, fastmath=True)
+def two_opt(dist: np.ndarray, max_iterations: int) -> np.ndarray:
+    """2-opt local search over a route distance matrix, returns the new point order"""
+    n = dist.shape[0]
+    order = np.arange(n)
+    improved = True
+    iteration = 0
+
+    while improved:
+        iteration += 1
+        if iteration > max_iterations:
+            break
+
+        improved = False
+        for i in range(1, n - 2):
+            for j in range(i + 1, n - 1):
+                # Only edges (i-1, i) and (j, j+1) change when reversing i..j
+                d_old = dist[order[i - 1], order[i]] + dist[order[j], order[j + 1]]
+                d_new = dist[order[i - 1], order[j]] + dist[order[i], order[j + 1]]
+
+                if d_new + EPS < d_old:
+                    # Reverse segment i..j in place
+                    a, b = i, j
+                    while a < b:
+                        order[a], order[b] = order[b], order[a]
+                        a += 1
+                        b -= 1
+                    improved = True
+                    break
+            if improved:
+                break
+
+    return order
+
+
+@njit(cache=True, fastmath=True)
+def geometric_optimization(route_xy: np.ndarray, obj_xy: np.ndarray, radius: float):
+    """Move interior route points along their object's survey circle, returns new coordinates and changed mask"""
+    n = route_xy.shape[0]
+    out = route_xy.copy()
+    changed = np.zeros(n, dtype=np.bool_)
+
+    if obj_xy.shape[0] == 0:
+        return out, changed
+
+    for i in range(1, n - 1):
+        rx, ry = route_xy[i, 0], route_xy[i, 1]
+
+        # Nearest object to this route point
+        d2 = (obj_xy[:, 0] - rx) ** 2 + (obj_xy[:, 1] - ry) ** 2
+        k = d2.argmin()
+        if d2[k] > radius * radius * (1.0 + RADIUS_TOL):
+            continue
+        ox, oy = obj_xy[k, 0], obj_xy[k, 1]
+
+        # Project object onto segment between neighbours
+        px, py = route_xy[i - 1, 0], route_xy[i - 1, 1]
+        nx, ny = route_xy[i + 1, 0], route_xy[i + 1, 1]
+        seg_x, seg_y = nx - px, ny - py
+        seg_len_sq = seg_x * seg_x + seg_y * seg_y
+
+        if seg_len_sq == 0:
+            proj_x, proj_y = px, py
+        else:
+            t = ((ox - px) * seg_x + (oy - py) * seg_y) / seg_len_sq
+            if t < 0.0:
+                t = 0.0
+            elif t > 1.0:
+                t = 1.0
+            proj_x, proj_y = px + t * seg_x, py + t * seg_y
+
+        # Use projection if it is inside survey radius, otherwise clamp to radius boundary
+        to_proj_x, to_proj_y = proj_x - ox, proj_y - oy
+        dist_to_proj = math.hypot(to_proj_x, to_proj_y)
+
+        if dist_to_proj == 0:
+            new_x, new_y = ox, oy
+        elif dist_to_proj <= radius:
+            new_x, new_y = proj_x, proj_y
+        else:
+            new_x = ox + to_proj_x / dist_to_proj * radius
+            new_y = oy + to_proj_y / dist_to_proj * radius
+
+        # Check if this improves the route
+        old_dist = math.hypot(px - rx, py - ry) + math.hypot(rx - nx, ry - ny)
+        new_dist = math.hypot(px - new_x, py - new_y) + math.hypot(new_x - nx, new_y - ny)
+
+        if new_dist < old_dist:
+            out[i, 0], out[i, 1] = new_x, new_y
+            changed[i] = True
+
+    return out, changed
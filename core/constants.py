@@ -0,0 +1,2 @@
+EPS = 1e-10  # minimal improvement accepted by local search
+RADIUS_TOL = 1e-9  # relative slack so points placed exactly on a survey circle count as inside
@@ -1,8 +1,10 @@
 import numpy as np
+from math import hypot, sqrt
 from typing import List, Tuple, Set
 
 from core.solver import Solver
 from core.point import Point
+from core.constants import RADIUS_TOL
 
 class GreedySolver(Solver):
     """Greedy algorithm implementation"""
@@ -10,27 +12,26 @@ class GreedySolver(Solver):
     def solve(self) -> Tuple[List[Point], Set[Point], float]:
         """Solve using greedy approach"""
         route = [self.map_data.start_point]
-        surveyed_objects = set()
+        surveyed_idx = []
         current_position = self.map_data.start_point
         route_length = 0.0
 
-        # Copy objects for working
-        unsurveyed_objects = set(self.map_data.objects)
+        objects = self.map_data.objects
+        survey_radius_sq = self.map_data.survey_radius ** 2 * (1 + RADIUS_TOL)
+
+        # Object coordinates as (N, 2) array and mask of unsurveyed objects
+        obj_xy = self.map_data.get_objects_xy()
+        alive = np.ones(len(objects), dtype=bool)
 
         while route_length + current_position.distance_to(
-                self.map_data.end_point) <= self.map_data.max_distance and unsurveyed_objects:
+                self.map_data.end_point) <= self.map_data.max_distance and alive.any():
             # Find nearest unsurveyed object
-            nearest_object = None
-            min_distance = float('inf')
-
-            for obj in unsurveyed_objects:
-                dist = current_position.distance_to(obj)
-                if dist < min_distance:
-                    min_distance = dist
-                    nearest_object = obj
-
-            if nearest_object is None:
-                break
+            dx = obj_xy[:, 0] - current_position.x
+            dy = obj_xy[:, 1] - current_position.y
+            d2 = dx * dx + dy * dy
+            d2[~alive] = np.inf
+            nearest_idx = int(d2.argmin())
+            nearest_object = objects[nearest_idx]
 
             # Find intersection point with survey circle
             intersection = self._find_intersection_with_circle(
@@ -38,7 +39,7 @@ class GreedySolver(Solver):
             )
 
             if intersection is None:
-                unsurveyed_objects.remove(nearest_object)
+                alive[nearest_idx] = False
                 continue
 
             # Check if we have enough fuel
@@ -54,27 +55,28 @@ class GreedySolver(Solver):
             route_length = new_route_length
             current_position = intersection
 
-            # Mark surveyed objects
-            objects_to_survey = []
-            for obj in unsurveyed_objects:
-                if intersection.distance_to(obj) <= self.map_data.survey_radius:
-                    objects_to_survey.append(obj)
+            # Mark surveyed objects (the target lies on its circle boundary,
+            # so it is surveyed regardless of rounding)
+            dx = obj_xy[:, 0] - intersection.x
+            dy = obj_xy[:, 1] - intersection.y
+            newly = alive & (dx * dx + dy * dy <= survey_radius_sq)
+            newly[nearest_idx] = True
+            alive &= ~newly
 
-            for obj in objects_to_survey:
-                surveyed_objects.add(obj)
-                unsurveyed_objects.remove(obj)
+            surveyed_idx.extend(np.flatnonzero(newly).tolist())
 
         # Check objects on path to end
-        if unsurveyed_objects and route_length + current_position.distance_to(
+        if alive.any() and route_length + current_position.distance_to(
                 self.map_data.end_point) <= self.map_data.max_distance:
-            for obj in unsurveyed_objects:
-                dist_to_path = self._point_to_line_distance(obj, current_position, self.map_data.end_point)
-                if dist_to_path <= self.map_data.survey_radius:
-                    surveyed_objects.add(obj)
+            for k in np.flatnonzero(alive).tolist():
+                dist_to_path_sq = self._point_to_line_dist_sq(objects[k], current_position, self.map_data.end_point)
+                if dist_to_path_sq <= survey_radius_sq:
+                    surveyed_idx.append(k)
 
         # Complete route
         route.append(self.map_data.end_point)
         total_distance = self.calculate_route_distance(route)
+        surveyed_objects = {objects[k] for k in surveyed_idx}
 
         self.route = route
         self.surveyed_objects = surveyed_objects
@@ -86,7 +88,7 @@ class GreedySolver(Solver):
         """Find intersection point with circle around object"""
         dx = target.x - start.x
         dy = target.y - start.y
-        dist = np.sqrt(dx ** 2 + dy ** 2)
+        dist = hypot(dx, dy)
 
         if dist == 0:
             return start
@@ -95,11 +97,8 @@ class GreedySolver(Solver):
         dx /= dist
         dy /= dist
 
-        # Distance from center to start
-        dist_to_center = start.distance_to(center)
-
         # If we're already inside the circle
-        if dist_to_center <= radius:
+        if start.sq_distance_to(center) <= radius * radius:
             return start
 
         # Projection of start->center on direction
@@ -112,14 +111,14 @@ class GreedySolver(Solver):
         closest_x = start.x + projection * dx
         closest_y = start.y + projection * dy
 
-        # Distance from center to closest point
-        dist_to_line = np.sqrt((center.x - closest_x) ** 2 + (center.y - closest_y) ** 2)
+        # Squared distance from center to closest point
+        dist_to_line_sq = (center.x - closest_x) ** 2 + (center.y - closest_y) ** 2
 
-        if dist_to_line > radius:
+        if dist_to_line_sq > radius * radius:
             return None
 
         # Distance from closest point to intersection
-        offset = np.sqrt(radius ** 2 - dist_to_line ** 2)
+        offset = sqrt(radius * radius - dist_to_line_sq)
 
         # Intersection point
         intersection_x = closest_x - offset * dx
@@ -127,20 +126,25 @@ class GreedySolver(Solver):
 
         return Point(intersection_x, intersection_y)
 
-    def _point_to_line_distance(self, point: Point, line_start: Point, line_end: Point) -> float:
-        """Calculate distance from point to line segment"""
+    def _point_to_line_dist_sq(self, point: Point, line_start: Point, line_end: Point) -> float:
+        """Calculate squared distance from point to line segment"""
         x1, y1 = line_start.x, line_start.y
-        x2, y2 = line_end.x, line_end.y
         x0, y0 = point.x, point.y
+        dx = line_end.x - x1
+        dy = line_end.y - y1
 
-        line_length = line_start.distance_to(line_end)
+        line_length_sq = dx * dx + dy * dy
 
-        if line_length == 0:
-            return point.distance_to(line_start)
+        if line_length_sq == 0:
+            return (x0 - x1) ** 2 + (y0 - y1) ** 2
 
-        t = max(0, min(1, ((x0 - x1) * (x2 - x1) + (y0 - y1) * (y2 - y1)) / line_length ** 2))
+        t = ((x0 - x1) * dx + (y0 - y1) * dy) / line_length_sq
+        if t < 0.0:
+            t = 0.0
+        elif t > 1.0:
+            t = 1.0
 
-        nearest_x = x1 + t * (x2 - x1)
-        nearest_y = y1 + t * (y2 - y1)
+        nearest_dx = x0 - x1 - t * dx
+        nearest_dy = y0 - y1 - t * dy
 
-        return np.sqrt((x0 - nearest_x) ** 2 + (y0 - nearest_y) ** 2)
+        return nearest_dx * nearest_dx + nearest_dy * nearest_dy
@@ -1,16 +1,21 @@
 import numpy as np
-from typing import List, Tuple, Set
+from typing import List, Tuple, Set, Optional
 from core.solver import Solver
 from core.point import Point
 from core.map import Map
+from core._numba_kernels import two_opt, geometric_optimization
 
 
 class HeuristicSolver(Solver):
     """Metaheuristic algorithm implementation"""
 
-    def __init__(self, map_data: Map):
+    def __init__(self, map_data: Map, seed: Optional[int] = None, restart: int = 0):
         super().__init__(map_data)
         self.max_iterations = 50
+        # Without seed the initial route is fully greedy. With seed it starts from object number restart
+        # of a seeded random permutation, so restarts sharing a seed start from different objects
+        self.seed = seed
+        self.restart = restart
 
     def solve(self) -> Tuple[List[Point], Set[Point], float]:
         """Solve using metaheuristic approach"""
@@ -47,134 +52,53 @@ class HeuristicSolver(Solver):
     def _greedy_initial_route(self) -> List[Point]:
         """Build initial route using greedy algorithm"""
         route = [self.map_data.start_point]
-        remaining_objects = self.map_data.objects.copy()
-        current_position = self.map_data.start_point
-
-        while remaining_objects:
-            closest_obj = min(remaining_objects, key=lambda obj: current_position.distance_to(obj))
-            route.append(closest_obj)
-            remaining_objects.remove(closest_obj)
-            current_position = closest_obj
+        obj_xy = self._pts[2:]
+        alive = np.ones(len(obj_xy), dtype=bool)
+        cx, cy = self.map_data.start_point.x, self.map_data.start_point.y
+
+        for step in range(len(obj_xy)):
+            if step == 0 and self.seed is not None:
+                order = np.random.default_rng(self.seed).permutation(len(obj_xy))
+                k = int(order[self.restart % len(obj_xy)])
+            else:
+                d2 = (obj_xy[:, 0] - cx) ** 2 + (obj_xy[:, 1] - cy) ** 2
+                d2[~alive] = np.inf
+                k = int(d2.argmin())
+            alive[k] = False
+            route.append(self.map_data.objects[k])
+            cx, cy = obj_xy[k]
 
         route.append(self.map_data.end_point)
         return route
 
     def _local_search_2opt(self, route: List[Point]) -> List[Point]:
         """Local search using 2-opt"""
-        best_route = route.copy()
-        best_distance = self.calculate_route_distance(best_route)
-        improved = True
-        iteration = 0
-
-        while improved:
-            iteration += 1
-            if iteration > self.max_iterations:
-                break
-
-            improved = False
-            for i in range(1, len(route) - 2):
-                for j in range(i + 1, len(route) - 1):
-                    # Create new route with reversed segment
-                    new_route = route[:i] + route[i:j + 1][::-1] + route[j + 1:]
-                    new_distance = self.calculate_route_distance(new_route)
+        order = two_opt(self._distance_matrix(route), self.max_iterations)
 
-                    if new_distance < best_distance:
-                        best_route = new_route
-                        best_distance = new_distance
-                        route = new_route
-                        improved = True
-                        break
-                if improved:
-                    break
-
-        return best_route
+        return [route[k] for k in order]
 
     def _geometric_optimization(self, route: List[Point]) -> List[Point]:
         """Geometric optimization of point positions"""
-        optimized_route = route.copy()
-
-        for i in range(1, len(route) - 1):
-            original_obj = None
-            # Find original object for this route point
-            for obj in self.map_data.objects:
-                if route[i].distance_to(obj) <= self.map_data.survey_radius:
-                    original_obj = obj
-                    break
+        route_xy = np.array([(p.x, p.y) for p in route], dtype=np.float64)
+        new_xy, changed = geometric_optimization(route_xy, self._pts[2:], self.map_data.survey_radius)
 
-            if original_obj:
-                new_position = self._optimize_point_position(
-                    original_obj, route[i - 1], route[i + 1]
-                )
-
-                # Check if this improves the route
-                old_dist = route[i - 1].distance_to(route[i]) + route[i].distance_to(route[i + 1])
-                new_dist = route[i - 1].distance_to(new_position) + new_position.distance_to(route[i + 1])
-
-                if new_dist < old_dist:
-                    optimized_route[i] = new_position
-
-        return optimized_route
+        return [Point(x, y) if moved else p for p, (x, y), moved in zip(route, new_xy.tolist(), changed.tolist())]
 
     def _remove_farthest_point(self, route: List[Point]) -> List[Point]:
         """Remove the point that least affects the route"""
         if len(route) <= 3:
             return [self.map_data.start_point, self.map_data.end_point]
 
-        best_route = route
-        best_score = float('inf')
+        # Removing point i saves d(i-1, i) + d(i, i+1) - d(i-1, i+1)
+        best_index = 1
+        best_saving = float('-inf')
 
         for i in range(1, len(route) - 1):
-            temp_route = route[:i] + route[i + 1:]
-            temp_distance = self.calculate_route_distance(temp_route)
-
-            if temp_distance < best_score:
-                best_score = temp_distance
-                best_route = temp_route
-
-        return best_route
-
-    def _project_point_on_segment(self, point: Point, seg_start: Point, seg_end: Point) -> Point:
-        """Project point onto line segment"""
-        seg_vec_x = seg_end.x - seg_start.x
-        seg_vec_y = seg_end.y - seg_start.y
-
-        point_vec_x = point.x - seg_start.x
-        point_vec_y = point.y - seg_start.y
-
-        seg_len_sq = seg_vec_x ** 2 + seg_vec_y ** 2
-
-        if seg_len_sq == 0:
-            return seg_start
-
-        t = max(0, min(1, (point_vec_x * seg_vec_x + point_vec_y * seg_vec_y) / seg_len_sq))
-
-        proj_x = seg_start.x + t * seg_vec_x
-        proj_y = seg_start.y + t * seg_vec_y
-
-        return Point(proj_x, proj_y)
-
-    def _optimize_point_position(self, obj_point: Point, prev_point: Point, next_point: Point) -> Point:
-        """Optimize position of point on survey radius boundary"""
-        projection = self._project_point_on_segment(obj_point, prev_point, next_point)
-
-        to_proj_x = projection.x - obj_point.x
-        to_proj_y = projection.y - obj_point.y
-        dist_to_proj = np.sqrt(to_proj_x ** 2 + to_proj_y ** 2)
-
-        if dist_to_proj == 0:
-            return obj_point
-
-        # Normalize vector
-        to_proj_x /= dist_to_proj
-        to_proj_y /= dist_to_proj
-
-        # If projection is closer than survey radius, use it
-        if dist_to_proj <= self.map_data.survey_radius:
-            return projection
-
-        # Otherwise move point to radius boundary
-        new_x = obj_point.x + to_proj_x * self.map_data.survey_radius
-        new_y = obj_point.y + to_proj_y * self.map_data.survey_radius
+            saving = (self._distance(route[i - 1], route[i]) + self._distance(route[i], route[i + 1])
+                      - self._distance(route[i - 1], route[i + 1]))
 
-        return Point(new_x, new_y)
+            if saving > best_saving:
+                best_saving = saving
+                best_index = i
 
+        return route[:best_index] + route[best_index + 1:]
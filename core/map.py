@@ -1,3 +1,4 @@
+import numpy as np
 from typing import List
 from core.point import Point
 
@@ -5,20 +6,58 @@ class Map:
     """Represents the task with all parameters"""
 
     def __init__(self, start: Point, end: Point, max_distance: float, survey_radius: float):
-        self.start_point = start
-        self.end_point = end
+        # Distance matrix rows: start, end, then objects in insertion order
+        self.start_point = self._own_point(start, 0)
+        self.end_point = self._own_point(end, 1)
         self.objects = []
+        self.object_names = []
+        # Object coordinates as (N, 2) array, rebuilt lazily after add_object
+        self._objects_xy = np.empty((0, 2), dtype=np.float64)
+        self._dirty = False
+        self._distance_matrix = None
         self.max_distance = max_distance
         self.survey_radius = survey_radius
 
     def add_object(self, point: Point):
         """Add an object for surveillance"""
+        point = self._own_point(point, len(self.objects) + 2)
         self.objects.append(point)
+        self.object_names.append(point.name)
+        self._dirty = True
+        self._distance_matrix = None
+
+    @staticmethod
+    def _own_point(point: Point, idx: int) -> Point:
+        """Copy of a point tagged with its distance matrix row, the caller's Point is left untouched"""
+        own = Point(point.x, point.y, point.name)
+        own.idx = idx
+        return own
 
     def get_objects(self) -> List[Point]:
         """Get list of objects"""
         return self.objects
 
+    def get_objects_xy(self) -> np.ndarray:
+        """Get read-only (N, 2) array of object coordinates"""
+        if self._dirty:
+            self._objects_xy = np.array([[obj.x, obj.y] for obj in self.objects], dtype=np.float64).reshape(-1, 2)
+            self._objects_xy.setflags(write=False)
+            self._dirty = False
+        return self._objects_xy
+
+    def get_distance_matrix(self) -> np.ndarray:
+        """Get read-only distance matrix between start, end and objects, indexed by Point.idx"""
+        if self._distance_matrix is None:
+            xy = np.vstack([
+                [[self.start_point.x, self.start_point.y],
+                 [self.end_point.x, self.end_point.y]],
+                self.get_objects_xy()
+            ])
+            diff = xy[:, None, :] - xy[None, :, :]
+            self._distance_matrix = np.sqrt((diff * diff).sum(axis=-1))
+            self._distance_matrix.setflags(write=False)
+        return self._distance_matrix
+
     def validate(self) -> bool:
         """Validate map data"""
         # Check if start and end points are different
@@ -45,7 +84,8 @@ class Map:
         return {
             "start_point": self.start_point.to_dict(),
             "end_point": self.end_point.to_dict(),
-            "objects": [obj.to_dict() for obj in self.objects],
+            "objects_xy": self.get_objects_xy().tolist(),
+            "objects_names": list(self.object_names),
             "max_distance": self.max_distance,
             "survey_radius": self.survey_radius
         }
@@ -59,6 +99,12 @@ class Map:
             data["max_distance"],
             data["survey_radius"]
         )
-        for obj_data in data["objects"]:
-            map_obj.add_object(Point.from_dict(obj_data))
+        if "objects_xy" in data:
+            names = data.get("objects_names") or [f"Object_{i + 1}" for i in range(len(data["objects_xy"]))]
+            for (x, y), name in zip(data["objects_xy"], names):
+                map_obj.add_object(Point(x, y, name))
+        else:
+            # Legacy format with one dictionary per object
+            for obj_data in data["objects"]:
+                map_obj.add_object(Point.from_dict(obj_data))
         return map_obj
\ No newline at end of file
@@ -1,41 +1,40 @@
-import numpy as np
+from math import hypot
 
 class Point:
     """Represents a point in 2D space"""
+    __slots__ = ('x', 'y', 'name', 'error', 'idx', '_key', '_hash')
+
     def __init__(self, x: float, y: float, name: str = ""):
-        self.x = x
-        self.y = y
+        # Plain floats keep NumPy scalars out of the hot scalar paths
+        self.x = float(x)
+        self.y = float(y)
         self.name = name
-        self.error = 1  # calculation error
+        self.error = 0.0  # calculation error
+        self.idx = None  # row in the distance matrix of the map that owns this point
+        # Coordinates quantized to the 0.01 comparison tolerance
+        self._key = (round(self.x, 2), round(self.y, 2))
+        self._hash = hash(self._key)
 
     def distance_to(self, other: 'Point') -> float:
         """Calculate Euclidean distance to another point"""
-        return np.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2) - self.error
-
-    def distance_point_to_segment(self, a: 'Point', b: 'Point') -> float:
-        # Вектор AB і AP
-        dx = b.x - a.x
-        dy = b.y - a.y
-        if dx == dy == 0:  # Відрізок — це точка
-            return self.distance_to(a)
-
-        # Проекція точки P на лінію AB, обмежена на [0, 1]
-        t = max(0, min(1, ((self.x - a.x) * dx + (self.y - a.y) * dy) / (dx * dx + dy * dy)))
+        return hypot(self.x - other.x, self.y - other.y) - self.error
 
-        # Найближча точка на відрізку
-        closest = Point(a.x + t * dx, a.y + t * dy)
-        return self.distance_to(closest)
+    def sq_distance_to(self, other: 'Point') -> float:
+        """Calculate squared Euclidean distance to another point"""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
 
     def __repr__(self):
         return f"Point({self.x}, {self.y}, '{self.name}')"
 
     def __eq__(self, other):
         if isinstance(other, Point):
-            return abs(self.x - other.x) < 0.01 and abs(self.y - other.y) < 0.01
+            return self._key == other._key
         return False
 
     def __hash__(self):
-        return hash((self.x, self.y))
+        return self._hash
 
     def to_dict(self):
         """Convert to dictionary for JSON serialization"""
@@ -1,8 +1,10 @@
 
+import numpy as np
 from typing import List, Tuple, Set
 from abc import ABC, abstractmethod
 from core.point import Point
 from core.map import Map
+from core.constants import RADIUS_TOL
 
 
 class Solver(ABC):
@@ -14,6 +16,14 @@ class Solver(ABC):
         self.surveyed_objects = set()
         self.total_distance = 0.0
 
+        # Start, end and objects coordinates, and their distances shared via the map (see Point.idx)
+        self._pts = np.vstack([
+            [[map_data.start_point.x, map_data.start_point.y],
+             [map_data.end_point.x, map_data.end_point.y]],
+            map_data.get_objects_xy()
+        ])
+        self._D = map_data.get_distance_matrix()
+
     @abstractmethod
     def solve(self) -> Tuple[List[Point], Set[Point], float]:
         """Solve the routing problem"""
@@ -24,25 +34,53 @@ class Solver(ABC):
         if len(route) < 2:
             return 0.0
 
+        idx = [p.idx for p in route]
+        if None not in idx:
+            return float(self._D[idx[:-1], idx[1:]].sum())
+
         total_distance = 0.0
         for i in range(len(route) - 1):
-            total_distance += route[i].distance_to(route[i + 1])
+            total_distance += self._distance(route[i], route[i + 1])
         return total_distance
 
+    def _distance(self, a: Point, b: Point) -> float:
+        """Distance between two points, taken from the distance matrix when both are map points"""
+        if a.idx is not None and b.idx is not None:
+            return self._D[a.idx, b.idx]
+        return a.distance_to(b)
+
+    def _distance_matrix(self, route: List[Point]) -> np.ndarray:
+        """Pairwise distance matrix between route points"""
+        idx = [p.idx for p in route]
+        if None not in idx:
+            return self._D[np.ix_(idx, idx)]
+        return self._pairwise_distances(np.array([[p.x, p.y] for p in route], dtype=np.float64))
+
+    @staticmethod
+    def _pairwise_distances(xy: np.ndarray) -> np.ndarray:
+        """Euclidean distance matrix for an (N, 2) coordinate array"""
+        diff = xy[:, None, :] - xy[None, :, :]
+        return np.sqrt((diff * diff).sum(axis=-1))
+
     def get_surveyed_objects(self, route: List[Point]) -> Set[Point]:
         """Determine which objects are surveyed by the route"""
-        surveyed = set()
         route = [self.map_data.start_point] + route + [self.map_data.end_point]
+        route_xy = np.array([[p.x, p.y] for p in route], dtype=np.float64)
+        obj_xy = self._pts[2:]
 
-        for obj in self.map_data.objects:
-            for i in range(len(route) - 1):
-                a = route[i]
-                b = route[i + 1]
-                if obj.distance_point_to_segment(a, b) <= self.map_data.survey_radius:
-                    surveyed.add(obj)
-                    break
+        # Closest point of every edge to every object, shapes (N, E, 2)
+        a = route_xy[:-1]
+        v = route_xy[1:] - a
+        w = obj_xy[:, None, :] - a[None, :, :]
+        len_sq = (v * v).sum(axis=-1)
+        t = np.divide((w * v).sum(axis=-1), len_sq, out=np.zeros(w.shape[:2]), where=len_sq > 0)
+        np.clip(t, 0.0, 1.0, out=t)
+        offset = w - t[..., None] * v
+        d2 = (offset * offset).sum(axis=-1)
 
-        return surveyed
+        radius_sq = self.map_data.survey_radius ** 2 * (1 + RADIUS_TOL)
+        surveyed_mask = (d2 <= radius_sq).any(axis=1)
+        return {self.map_data.objects[k] for k in np.flatnonzero(surveyed_mask)}
 
     def is_valid_route(self, route: List[Point]) -> bool:
         """Check if route is valid"""
@@ -1,4 +1,5 @@
-from typing import List
+from typing import List, Dict, Tuple, Optional
+from multiprocessing import Pool
 import random
 from core.point import Point
 from core.map import Map
@@ -11,6 +12,7 @@ class DataGenerator:
         self.max_objects = 50
         self.distance_options = [100, 150, 200, 250, 300, 350, 400, 450, 500]
         self.radius_range = (0, 15)
+        self.min_distance = 5.0  # Minimum distance between points
 
     def generate_single_task(self, n: int, L: float, r: float) -> Map:
         """Generate single task with specific parameters"""
@@ -24,34 +26,45 @@ class DataGenerator:
         # Create map
         map_data = Map(start, end, L, r)
 
+        # Uniform grid of placed points with cell size min_distance
+        grid = {}
+        for point in (start, end):
+            self._grid_insert(grid, point.x, point.y)
+
         # Generate objects
         for i in range(n):
             while True:
                 x = random.uniform(0, self.plane_size)
                 y = random.uniform(0, self.plane_size)
-                new_point = Point(x, y, f"Object_{ i +1}")
 
                 # Check uniqueness
-                if self._is_point_unique(new_point, [start, end] + map_data.objects):
-                    map_data.add_object(new_point)
+                if self._is_free_in_grid(grid, x, y):
+                    self._grid_insert(grid, x, y)
+                    map_data.add_object(Point(x, y, f"Object_{ i +1}"))
                     break
 
         return map_data
 
-    def generate_test_suite(self) -> List[Map]:
-        """Generate comprehensive test suite"""
-        test_suite = []
+    def generate_test_suite(self, seed: int = 0, processes: Optional[int] = None) -> List[Map]:
+        """Generate comprehensive test suite, in a pool of worker processes if processes is given"""
+        rng = random.Random(seed)
+        tasks = []
 
         # Generate tasks with different parameters
         for n in range(self.min_objects, self.max_objects, 5):  # 5, 10, 15, ..., 50 objects
             for L in self.distance_options:
                 # Generate 3 different radius values for each combination
                 for _ in range(3):
-                    r = random.uniform(*self.radius_range)
-                    map_data = self.generate_single_task(n, L, r)
-                    test_suite.append(map_data)
+                    r = rng.uniform(*self.radius_range)
+                    tasks.append((self, n, L, r, rng.getrandbits(32)))
+
+        # Every task has an explicit seed, so both paths give the same maps.
+        # Tasks take well under a millisecond, a pool only pays off for much larger suites
+        if processes is None:
+            return [_generate_seeded_task(*task) for task in tasks]
 
-        return test_suite
+        with Pool(processes) as pool:
+            return pool.starmap(_generate_seeded_task, tasks)
 
     def generate_random_point(self, exclude_points: List[Point] = None) -> Point:
         """Generate random point that doesn't overlap with existing points"""
@@ -68,9 +81,31 @@ class DataGenerator:
 
     def _is_point_unique(self, point: Point, existing_points: List[Point]) -> bool:
         """Check if point is unique (doesn't overlap with existing points)"""
-        min_distance = 5.0  # Minimum distance between points
-
         for existing in existing_points:
-            if point.distance_to(existing) < min_distance:
+            if point.distance_to(existing) < self.min_distance:
                 return False
-        return True
\ No newline at end of file
+        return True
+
+    def _grid_insert(self, grid: Dict[Tuple[int, int], List[Tuple[float, float]]], x: float, y: float):
+        """Add point coordinates to the grid cell containing them"""
+        cell = (int(x // self.min_distance), int(y // self.min_distance))
+        grid.setdefault(cell, []).append((x, y))
+
+    def _is_free_in_grid(self, grid: Dict[Tuple[int, int], List[Tuple[float, float]]], x: float, y: float) -> bool:
+        """Check point against the 9 grid cells around it"""
+        min_distance_sq = self.min_distance ** 2
+        cx = int(x // self.min_distance)
+        cy = int(y // self.min_distance)
+
+        for i in range(cx - 1, cx + 2):
+            for j in range(cy - 1, cy + 2):
+                for px, py in grid.get((i, j), ()):
+                    if (px - x) ** 2 + (py - y) ** 2 < min_distance_sq:
+                        return False
+        return True
+
+
+def _generate_seeded_task(generator: DataGenerator, n: int, L: float, r: float, seed: int) -> Map:
+    """Generate single task with its own random seed (module level so worker processes can run it)"""
+    random.seed(seed)
+    return generator.generate_single_task(n, L, r)
@@ -6,6 +6,45 @@ from core.point import Point
 from core.map import Map
 from data.visualizer import Visualizer
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, indent=2).encode()
+
+
+def _dumps_compact(data) -> bytes:
+    """Serialize data to single-line JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _loads(raw: bytes):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_json(filepath: str, data):
+    """Serialize data in memory and write it with a single write"""
+    with open(filepath, 'wb') as f:
+        f.write(_dumps(data))
+
+
+def _read_json(filepath: str):
+    """Read whole file with a single read and parse it"""
+    with open(filepath, 'rb') as f:
+        return _loads(f.read())
+
+
 class DataManager:
     """Handles data input/output operations"""
 
@@ -18,15 +57,13 @@ class DataManager:
     def save_map_to_file(self, map_data: Map, filename: str):
         """Save map data to JSON file"""
         filepath = os.path.join(self.input_dir, filename)
-        with open(filepath, 'w') as f:
-            json.dump(map_data.to_dict(), f, indent=2)
+        _write_json(filepath, map_data.to_dict())
         print(f"Map saved to {filepath}")
 
     def load_map_from_file(self, filename: str) -> Map:
         """Load map data from JSON file"""
         filepath = os.path.join(self.input_dir, filename)
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        data = _read_json(filepath)
         return Map.from_dict(data)
 
     def save_results_to_file(self, results: Dict, filename: str):
@@ -36,7 +73,22 @@ class DataManager:
         file_dir = os.path.join(*parts)
         os.makedirs(file_dir, exist_ok=True)
 
-        # Convert complex objects to serializable format
+        _write_json(filepath, self._serialize_results(results))
+        print(f"Results saved to {filepath}")
+
+    def open_results_batch(self, filename: str):
+        """Open JSON Lines file collecting results of a whole batch"""
+        filepath = os.path.join(self.output_dir, filename)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        print(f"Results will be saved to {filepath}")
+        return open(filepath, 'wb', buffering=1 << 20)
+
+    def append_results_to_batch(self, batch_file, results: Dict):
+        """Write results of one map to batch file as a single compact JSON line"""
+        batch_file.write(_dumps_compact(self._serialize_results(results)) + b"\n")
+
+    def _serialize_results(self, results: Dict) -> Dict:
+        """Convert complex objects to serializable format"""
         serializable_results = {}
         for key, value in results.items():
             if isinstance(value, dict):
@@ -49,18 +101,14 @@ class DataManager:
                 }
             else:
                 serializable_results[key] = value
-
-        with open(filepath, 'w') as f:
-            json.dump(serializable_results, f, indent=2)
-        print(f"Results saved to {filepath}")
+        return serializable_results
 
     def load_results_from_file(self, filename: str) -> Dict:
         """Load results from JSON file"""
 
         filepath = os.path.join(self.output_dir, filename)
 
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        data = _read_json(filepath)
 
         # Convert back to objects
         results = {}
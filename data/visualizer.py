@@ -1,5 +1,3 @@
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 from typing import List, Set, Dict, Any
 from core.point import Point
 from core.map import Map
@@ -12,6 +10,9 @@ class Visualizer:
 
     def visualize_map(self, map_data: Map):
         """Visualize map with objects"""
+        import matplotlib.pyplot as plt
+        import matplotlib.patches as patches
+
         fig, ax = plt.subplots(1, 1, figsize=(10, 8))
 
         # Plot objects
@@ -38,8 +39,15 @@ class Visualizer:
         plt.show()
 
     def visualize_results(self, map_data: Map, route: List[Point], surveyed: Set[Point], solver_name: str, filename: str):
-        """Visualize routing results"""
-        fig, ax = plt.subplots(1, 1, figsize=(12, 10))
+        """Visualize routing results and save them to file"""
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        import matplotlib.patches as patches
+
+        # Standalone Agg figure, safe to render from worker threads
+        fig = Figure(figsize=(12, 10))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots(1, 1)
 
         # Plot objects
         for obj in map_data.objects:
@@ -87,18 +95,23 @@ Used: {total_distance / map_data.max_distance * 100:.1f}%"""
         ax.axis('equal')
         ax.set_title(f'UAV Route - {solver_name} Algorithm')
 
-        plt.tight_layout()
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.show()
+        fig.tight_layout()
+        fig.savefig(filename, dpi=300, bbox_inches='tight')
 
 
     def visualize_comparison(self, results: Dict[str, Any], filename: str):
-        """Visualize comparison of different algorithms"""
+        """Visualize comparison of different algorithms and save it to file"""
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
         algorithms = list(results.keys())
         coverages = [r['coverage'] for r in results.values()]
         distances = [r['distance'] for r in results.values()]
 
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+        # Standalone Agg figure, safe to render from worker threads
+        fig = Figure(figsize=(12, 5))
+        FigureCanvasAgg(fig)
+        ax1, ax2 = fig.subplots(1, 2)
 
         # Coverage comparison
         ax1.bar(algorithms, coverages, color=['blue', 'green'])
@@ -117,13 +130,14 @@ Used: {total_distance / map_data.max_distance * 100:.1f}%"""
         for i, v in enumerate(distances):
             ax2.text(i, v + 2, f'{v:.1f}', ha='center')
 
-        plt.tight_layout()
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.show()
+        fig.tight_layout()
+        fig.savefig(filename, dpi=300, bbox_inches='tight')
 
 
     def save_plot(self, filename: str):
         """Save current plot to file"""
+        import matplotlib.pyplot as plt
+
         plt.savefig(filename, dpi=300, bbox_inches='tight')
         print(f"Plot saved to {filename}")
 
@@ -1,8 +1,11 @@
 import os.path
-from typing import List, Dict
+from typing import List, Dict, Tuple, Optional
 import argparse
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-import random
+import time
+
+import numpy as np
 
 from data.data_manager import DataManager
 from data.visualizer import Visualizer
@@ -24,66 +27,114 @@ class Runner:
             'heuristic': HeuristicSolver
         }
         self.path = os.path.join("data", "output") # "data/output"
-        self.output = str(max((int(f) for f in os.listdir(self.path) if f.isdigit() and os.path.isdir(os.path.join(self.path, f))),
-                  default=0) + 1)
+        with os.scandir(self.path) as entries:
+            self.output = str(max((int(e.name) for e in entries if e.name.isdigit() and e.is_dir(follow_symlinks=False)),
+                                  default=0) + 1)
 
-        os.makedirs(os.path.join(self.path, self.output), exist_ok=True)
+        # Run output directory, joined once and reused for every file name
+        self._out_dir = os.path.join(self.path, self.output)
+        os.makedirs(self._out_dir, exist_ok=True)
 
-    def run_single_experiment(self, map_data: Map) -> Dict:
-        """Run experiment with single map"""
-        results = {}
+        # Number of independent heuristic runs per map, the best one is kept.
+        # Restarts of a map share the seed, so they start from different objects
+        self.restarts = 1
+        self.seed = 0
+        self.plots = True
 
-        for name, solver_class in self.solvers.items():
-            print(f"\nRunning {name} algorithm...")
-            solver = solver_class(map_data)
+        # Worker processes are started once and reused across batches until shutdown()
+        self._executor = None
 
-            import time
-            start_time = time.time()
-            route, surveyed, distance = solver.solve()
-            end_time = time.time()
+    def __enter__(self):
+        return self
 
-            coverage = len(surveyed) / len(map_data.objects) * 100 if map_data.objects else 0
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
 
-            results[name] = {
-                'route': route,
-                'surveyed_objects': surveyed,
-                'distance': distance,
-                'coverage': coverage,
-                'computation_time': end_time - start_time
-            }
+    def get_executor(self) -> ProcessPoolExecutor:
+        """Get process pool with warmed-up workers, created on first use"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker)
+        return self._executor
 
-            print(f"  Completed in {end_time - start_time:.3f}s")
-            print(f"  Coverage: {coverage:.1f}%")
+    def shutdown(self):
+        """Stop worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
+    def run_single_experiment(self, map_data: Map) -> Dict:
+        """Run experiment with single map in this process"""
+        results = {}
+        for name, solver_class, restart in self._experiment_tasks():
+            _merge_result(results, name, _run_solver(name, solver_class, map_data, restart, self.seed))
         return results
 
+    def submit_experiment(self, map_data: Map) -> List[Tuple[str, Future]]:
+        """Submit every solver run of a map as a separate worker task, returns (solver name, future) pairs"""
+        executor = self.get_executor()
+        return [(name, executor.submit(_run_solver, name, solver_class, map_data, restart, self.seed))
+                for name, solver_class, restart in self._experiment_tasks()]
+
+    @staticmethod
+    def collect_experiment(futures: List[Tuple[str, Future]]) -> Dict:
+        """Wait for submitted experiment and keep the best run of each solver"""
+        results = {}
+        for name, future in futures:
+            _merge_result(results, name, future.result())
+        return results
+
+    def _experiment_tasks(self) -> List[Tuple[str, type, Optional[int]]]:
+        """Solver runs of one map as (name, solver class, restart), restart is None for the plain run"""
+        tasks = [(name, solver_class, None) for name, solver_class in self.solvers.items()]
+        # Only heuristic solvers are restarted, each restart from a different start object
+        tasks += [(name, solver_class, restart)
+                  for name, solver_class in self.solvers.items() if issubclass(solver_class, HeuristicSolver)
+                  for restart in range(self.restarts - 1)]
+        return tasks
+
     def run_batch_experiments(self, test_suite: List[Map]) -> List[Dict]:
         """Run experiments on multiple maps"""
         all_results = []
 
-        for i, map_data in enumerate(test_suite):
-            print(f"\nProcessing map {i + 1}/{len(test_suite)}...")
-            results = self.run_single_experiment(map_data)
+        # Maps are independent, solve them in worker processes (kept alive for the next batch)
+        tasks = [self.submit_experiment(map_data) for map_data in test_suite]
+
+        for i, futures in enumerate(tasks):
+            results = self.collect_experiment(futures)
+            print(f"\nProcessed map {i + 1}/{len(test_suite)}")
             results['map_index'] = i
             all_results.append(results)
 
         return all_results
 
-    def compare_algorithms(self, map_data: Map, i: int) -> Dict:
+    def compare_algorithms(self, map_data: Map, i: int, results: Dict = None) -> Dict:
         """Compare different algorithms on the same map"""
-        results = self.run_single_experiment(map_data)
+        if results is None:
+            results = self.run_single_experiment(map_data)
 
-        # Visualize each algorithm's results
-        for name, data in results.items():
-            if isinstance(data, dict) and 'route' in data:
-                self.visualizer.visualize_results(
+        if not self.plots:
+            return results
+
+        # Render plots in parallel, each task draws its own figure
+        with ThreadPoolExecutor(max_workers=len(results) + 1) as executor:
+            # Visualize each algorithm's results
+            futures = [
+                executor.submit(
+                    self.visualizer.visualize_results,
                     map_data, data['route'], data['surveyed_objects'], name.upper(),
-                    os.path.join(self.path, self.output, f"{name}_{i}.png")
+                    f"{self._out_dir}{os.sep}{name}_{i}.png"
                 )
+                for name, data in results.items() if isinstance(data, dict) and 'route' in data
+            ]
 
-        # Show comparison
-        self.visualizer.visualize_comparison(results, os.path.join(self.path, self.output, f"compare_{i}.png"))
+            # Show comparison, only meaningful for several algorithms
+            if len(self.solvers) > 1:
+                futures.append(executor.submit(
+                    self.visualizer.visualize_comparison, results, f"{self._out_dir}{os.sep}compare_{i}.png"
+                ))
 
+            for future in futures:
+                future.result()
 
         return results
 
@@ -98,6 +149,12 @@ class Runner:
                             help='Number of test cases to generate')
         parser.add_argument('--file', action='store_true',
                             help='Use existing files from input directory')
+        parser.add_argument('--single-output', action='store_true',
+                            help='Save results of all maps to one JSON Lines file')
+        parser.add_argument('--restarts', type=int, default=1,
+                            help='Number of parallel heuristic restarts per map')
+        parser.add_argument('--no-plots', action='store_true',
+                            help='Skip plotting, only compute and save metrics')
 
         args = parser.parse_args()
 
@@ -108,6 +165,8 @@ class Runner:
             active_solvers = {args.algorithm: self.solvers[args.algorithm]}
 
         self.solvers = active_solvers
+        self.restarts = max(1, args.restarts)
+        self.plots = not args.no_plots
 
         # Get maps to process
         maps_to_process = []
@@ -130,17 +189,21 @@ class Runner:
         elif args.generate:
             # Generate new maps
             print(f"Generating {args.number} test cases...")
-            for i in range(args.number):
-                n_objects = random.randint(30, 35)
-                max_distance = random.choice(self.data_generator.distance_options)
-                survey_radius = random.uniform(5, 15)
 
+            # Draw parameters of all maps at once
+            rng = np.random.default_rng()
+            objects_counts = rng.integers(30, 36, size=args.number).tolist()
+            max_distances = rng.choice(self.data_generator.distance_options, size=args.number).tolist()
+            survey_radii = rng.uniform(5, 15, size=args.number).tolist()
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+            for i in range(args.number):
                 map_data = self.data_generator.generate_single_task(
-                    n_objects, max_distance, survey_radius
+                    objects_counts[i], max_distances[i], survey_radii[i]
                 )
 
                 # Save generated map
-                filename = f"generated_map_{i + 1}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                filename = f"generated_map_{i + 1}_{timestamp}.json"
                 self.data_manager.save_map_to_file(map_data, filename)
                 maps_to_process.append(map_data)
 
@@ -151,30 +214,108 @@ class Runner:
         # Process all maps
         print(f"\nProcessing {len(maps_to_process)} maps with {list(active_solvers.keys())} algorithm(s)...")
 
+        valid_maps = []
         for i, map_data in enumerate(maps_to_process):
-            print(f"\n{'=' * 60}")
-            print(f"Processing Map {i + 1}/{len(maps_to_process)}")
-            print(f"{'=' * 60}")
-            print(f"Objects: {len(map_data.objects)}")
-            print(f"Max distance: {map_data.max_distance}")
-            print(f"Survey radius: {map_data.survey_radius}")
-
             # Validate map
             if not map_data.validate():
-                print("Warning: Map validation failed, skipping...")
+                print(f"Warning: Map {i + 1} validation failed, skipping...")
                 continue
+            valid_maps.append((i, map_data))
 
-            # Run experiments
-            results = self.compare_algorithms(map_data, i)
-
-            # Save results
+        batch_file = None
+        if args.single_output:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            results_filename = f"results_map_{i + 1}_{timestamp}.json"
-
-            self.data_manager.save_results_to_file(results, os.path.join(self.output, results_filename))
-
-
-            # Print results
-            self.data_manager.print_results_to_console(results)
-
-        print("\nAll tasks completed!")
\ No newline at end of file
+            batch_file = self.data_manager.open_results_batch(
+                f"{self.output}{os.sep}results_batch_{timestamp}.jsonl"
+            )
+
+        # Solve maps in worker processes, visualize and save in this one
+        try:
+            if len(valid_maps) == 1:
+                # A single map is solved here, a worker pool would only add start-up cost
+                experiments = [self.run_single_experiment(valid_maps[0][1])]
+            else:
+                # Results are collected in map order, so console output and batch lines follow the input
+                tasks = [self.submit_experiment(map_data) for _, map_data in valid_maps]
+                experiments = (self.collect_experiment(futures) for futures in tasks)
+
+            for (i, map_data), experiment in zip(valid_maps, experiments):
+                print(f"\n{'=' * 60}")
+                print(f"Processing Map {i + 1}/{len(maps_to_process)}")
+                print(f"{'=' * 60}")
+                print(f"Objects: {len(map_data.objects)}")
+                print(f"Max distance: {map_data.max_distance}")
+                print(f"Survey radius: {map_data.survey_radius}")
+
+                # Visualize experiment results
+                results = self.compare_algorithms(map_data, i, experiment)
+
+                # Save results
+                if batch_file is not None:
+                    self.data_manager.append_results_to_batch(batch_file, {**results, 'map_index': i})
+                else:
+                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                    results_filename = f"{self.output}{os.sep}results_map_{i + 1}_{timestamp}.json"
+
+                    self.data_manager.save_results_to_file(results, results_filename)
+
+                # Print results
+                self.data_manager.print_results_to_console(results)
+        finally:
+            self.shutdown()
+            if batch_file is not None:
+                batch_file.close()
+
+        print("\nAll tasks completed!")
+
+
+def _init_worker():
+    """Prepare worker process once: compile the numba kernels or load them from cache"""
+    from core._numba_kernels import two_opt, geometric_optimization
+
+    # Solver instances depend on the map, so only the kernels are warmed up here
+    xy = np.zeros((4, 2))
+    two_opt(np.zeros((4, 4)), 1)
+    geometric_optimization(xy, xy, 1.0)
+
+
+def _run_solver(name: str, solver_class: type, map_data: Map, restart: Optional[int] = None, seed: int = 0) -> Dict:
+    """Run and time one solver on a map (module level so worker processes can run it)"""
+    label = name if restart is None else f"{name} (restart {restart + 1})"
+    print(f"\nRunning {label} algorithm...")
+
+    if restart is None:
+        solver = solver_class(map_data)
+    else:
+        solver = solver_class(map_data, seed=seed, restart=restart)
+    start_ns = time.perf_counter_ns()
+    route, surveyed, distance = solver.solve()
+    elapsed = (time.perf_counter_ns() - start_ns) * 1e-9
+
+    coverage = len(surveyed) / len(map_data.objects) * 100 if map_data.objects else 0
+
+    print(f"  {label} completed in {elapsed:.3f}s")
+    print(f"  {label} coverage: {coverage:.1f}%")
+
+    return {
+        'route': route,
+        'surveyed_objects': surveyed,
+        'distance': distance,
+        'coverage': coverage,
+        'computation_time': elapsed
+    }
+
+
+def _merge_result(results: Dict, name: str, result: Dict):
+    """Add a solver run to results, keeping its best run (best coverage, then shortest route)
+    and the total computation time of all its runs"""
+    current = results.get(name)
+    if current is None:
+        results[name] = result
+        return
+
+    def key(run):
+        return len(run['surveyed_objects']), -run['distance']
+
+    best = result if key(result) > key(current) else current
+    results[name] = {**best, 'computation_time': current['computation_time'] + result['computation_time']}